@@ -0,0 +1,13 @@
+import pytest
+
+from health_checker.logger import flush_logs
+
+
+@pytest.fixture(autouse=True)
+def _flush_buffered_logs():
+    """
+    Write out buffered log records while pytest's captured stdout is still
+    open, rather than at interpreter shutdown
+    """
+    yield
+    flush_logs()
@@ -3,7 +3,7 @@ Entry point for lambda
 """
 
 from .main import handler
-from .logger import get_logger
+from .logger import get_logger, flush_logs
 from logging import Logger
 
 # ────────────────────── Getting logger ─────────────────────────────
@@ -24,6 +24,9 @@ def lambda_handler(event, context):
     Returns:
         dict: Response with status code
     """
-    result = handler(event, context)
-    logger.info(result["body"])
-    return result
+    try:
+        result = handler(event, context)
+        logger.info(result["body"])
+        return result
+    finally:
+        flush_logs()
@@ -1,11 +1,18 @@
 """
 Database access functionality for health checker
+
+Queries filter runAudits on function_name and a function_start_time range, so
+the table is expected to carry a composite index on those columns:
+
+    CREATE INDEX idx_runaudits_function_start
+        ON runAudits (function_name, function_start_time);
 """
 
-from typing import List, Dict, Mapping, Any
+from typing import List, Dict, Mapping, Any, Tuple
 import os
+from collections import defaultdict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import mysql.connector
 from mysql.connector.pooling import MySQLConnectionPool
@@ -46,9 +53,10 @@ def init_pool(db_config: Dict[str, str]) -> None:
         "charset": "utf8mb4",
     }
 
+    # A single invocation only ever holds one connection at a time
     _POOL = MySQLConnectionPool(
         pool_name="live_station_pool",
-        pool_size=int(os.getenv("DB_POOL_SIZE", 4)),
+        pool_size=int(os.getenv("DB_POOL_SIZE", 1)),
         **pool_kwargs,
     )
     logger.debug("Database connection pool initialized")
@@ -63,21 +71,20 @@ def get_conn() -> Any:
     Handles Connectioning to DB and commiting/rolling back DB queries
 
     Raises:
-        DatabaseError: If the connection cannot be created
+        DatabaseError: If the connection pool has not been initialized
     """
     if _POOL is None:
-        return
+        raise DatabaseError("Pool not initialized")
 
     connection = _POOL.get_connection()
 
     try:
         yield connection
-        logger.debug("Transaction commited")
         connection.commit()
-    except DatabaseError as e:
+    except Exception as e:
         connection.rollback()
-        logger.error(f"Failed to connect and commit transaction to database: {e}")
-        raise e
+        logger.error("Failed to connect and commit transaction to database: %s", e)
+        raise
     finally:
         connection.close()
 
@@ -90,8 +97,7 @@ def get_cursor(connection: Any) -> Any:
     Args:
         connection: Connection to the database from connection pool
     """
-    cursor = connection.cursor(dictionary=True)
-    logger.debug("Cursor created")
+    cursor = connection.cursor()
     try:
         yield cursor
     except Exception as e:
@@ -102,6 +108,28 @@ def get_cursor(connection: Any) -> Any:
 
 # ────────────────────── Database query logic ─────────────────────────────
 
+# Column positions of the tuples returned by the runAudits row queries
+RUN_ID = 0
+RECORDS_WRITTEN = 1
+RECORDS_READ = 2
+STATUS = 3
+FUNCTION_START_TIME = 4
+FUNCTION_NAME = 5
+
+
+def _day_bounds(date: str) -> Tuple[str, str]:
+    """
+    Converts a date into the half-open [start, end) range covering that day
+
+    Args:
+        date: date in %Y-%m-%d format
+
+    Returns:
+        Tuple[str, str]: start of the given day and start of the next day
+    """
+    end = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    return date, end
+
 
 def return_function_rows(function_name: str, date: str) -> List:
     """
@@ -113,21 +141,108 @@ def return_function_rows(function_name: str, date: str) -> List:
         date: date when invokation took place
 
     Returns:
-        List: list of dicts, one dict for each row containing the
-        revelvent data
+        List: list of tuples, one tuple for each row containing the
+        revelvent data in (run_id, records_written, records_read, status,
+        function_start_time, function_name) order
     """
     try:
-        logger.info(f"Getting database rows for {function_name} on {date}")
+        logger.info("Getting database rows for %s on %s", function_name, date)
         with get_conn() as connection, get_cursor(connection) as cursor:
             cursor.execute(
                 """
-                SELECT * FROM runAudits WHERE function_name = %s 
-                AND function_start_time LIKE %s
+                SELECT run_id, records_written, records_read, status,
+                function_start_time, function_name
+                FROM runAudits WHERE function_name = %s
+                AND function_start_time >= %s AND function_start_time < %s
                 """,
-                (function_name, f"{date}%"),
+                (function_name, *_day_bounds(date)),
             )
             result = cursor.fetchall()
             return result
     except:
-        logger.warning(f"Failed to find any rows for the {function_name} function")
+        logger.warning("Failed to find any rows for the %s function", function_name)
+        raise
+
+
+def return_multi_function_rows(function_names: List[str], date: str) -> Dict[str, List]:
+    """
+    Queries database for runAudits rows for all of the given functions
+    on the given date in a single round-trip
+
+    Args:
+        function_names: names of functions to query for
+        date: date when invokations took place
+
+    Returns:
+        Dict[str, List]: rows for each function, keyed by function name, in
+        the same column order as return_function_rows. Functions with no
+        rows map to an empty list
+    """
+    format_strings = ",".join(["%s"] * len(function_names))
+    params = [*function_names, *_day_bounds(date)]
+    try:
+        logger.info("Getting database rows for %s on %s", function_names, date)
+        with get_conn() as connection, get_cursor(connection) as cursor:
+            cursor.execute(
+                f"""
+                SELECT run_id, records_written, records_read, status,
+                function_start_time, function_name
+                FROM runAudits WHERE function_name IN ({format_strings})
+                AND function_start_time >= %s AND function_start_time < %s
+                """,
+                params,
+            )
+            grouped_rows: Dict[str, List] = defaultdict(list)
+            for row in cursor.fetchall():
+                grouped_rows[row[FUNCTION_NAME]].append(row)
+            return grouped_rows
+    except Exception:
+        logger.warning("Failed to find any rows for the %s functions", function_names)
+        raise
+
+
+def return_function_summary(
+    function_names: List[str], date: str
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Counts the total and errored runAudits rows for each of the given
+    functions on the given date, aggregated server side so only one row per
+    function is sent back
+
+    A row is errored if records written and read differ, or its status is not
+    one of SUCCESS_WITH_DATA / SUCCESS_NO_DATA (matching query_parser)
+
+    Args:
+        function_names: names of functions to query for
+        date: date when invokations took place
+
+    Returns:
+        Dict[str, Tuple[int, int]]: (total, errored) counts keyed by function
+        name. Functions with no rows are absent
+    """
+    format_strings = ",".join(["%s"] * len(function_names))
+    params = [*function_names, *_day_bounds(date)]
+    try:
+        logger.info("Getting database summary for %s on %s", function_names, date)
+        with get_conn() as connection, get_cursor(connection) as cursor:
+            cursor.execute(
+                f"""
+                SELECT function_name,
+                COUNT(*) AS total,
+                SUM(CASE WHEN NOT (records_written <=> records_read)
+                    OR status IS NULL
+                    OR UPPER(status) NOT IN ('SUCCESS_WITH_DATA', 'SUCCESS_NO_DATA')
+                    THEN 1 ELSE 0 END) AS errored
+                FROM runAudits WHERE function_name IN ({format_strings})
+                AND function_start_time >= %s AND function_start_time < %s
+                GROUP BY function_name
+                """,
+                params,
+            )
+            return {
+                function_name: (int(total), int(errored))
+                for function_name, total, errored in cursor.fetchall()
+            }
+    except Exception:
+        logger.warning("Failed to summarise rows for the %s functions", function_names)
         raise
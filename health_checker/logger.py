@@ -3,40 +3,87 @@ Structured JSON logger shared by all modules.
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 import traceback
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 # ─────────────────────────── fixed-path import ──────────────────────────────
 
-from pythonjsonlogger.json import JsonFormatter
+import orjson
 
 
 # ───────────────────────────── custom formatter ─────────────────────────────
-class LineWiseJsonFormatter(JsonFormatter):  # type: ignore[misc, valid-type]
+class LineWiseJsonFormatter(logging.Formatter):
     """
     Custom JSON formatter that converts exception information to a list of lines.
 
-    This formatter extends the standard JsonFormatter to provide better formatting
-    of exception information in the logs, making them more readable and structured.
+    Each record is rendered as a single JSON object serialised with orjson,
+    making exception information in the logs more readable and structured.
     """
 
-    def add_fields(  # type: ignore[override]
-        self,
-        log_record: Dict[str, Any],
-        record: logging.LogRecord,
-        message_dict: Dict[str, Any],
-    ) -> None:
-        super().add_fields(log_record, record, message_dict)
-
-        # Convert exc_info string to list-of-lines for cleaner JSON
+    def format(self, record: logging.LogRecord) -> str:
+        log_record: Dict[str, Any] = {
+            "asctime": self.formatTime(record, self.datefmt),
+            "levelname": record.levelname,
+            "name": record.name,
+            "message": record.getMessage(),
+            "session_id": getattr(record, "session_id", None),
+            "aws_request_id": getattr(record, "aws_request_id", None),
+        }
+
+        # Convert exc_info to list-of-lines for cleaner JSON
         if record.exc_info:
             exc_type, exc_value, exc_tb = record.exc_info
             log_record["trace"] = traceback.format_exception(
                 exc_type, exc_value, exc_tb
             )
-            log_record.pop("exc_info", None)
+
+        return orjson.dumps(log_record, default=str).decode()
+
+
+# ───────────────────────────── buffered handler ─────────────────────────────
+class BatchedMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    Memory handler that writes all buffered records to its target stream in a
+    single write, instead of one write and flush per record.
+
+    Records are held until the buffer fills, an ERROR (or worse) record is
+    logged, or flush() is called explicitly at the end of an invocation.
+    """
+
+    target: logging.StreamHandler
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self.target is None or not self.buffer:
+                return
+
+            # Same per-record rules as target.handle(): level and filters
+            # apply, and a record that fails to format is reported and dropped
+            lines: List[str] = []
+            for record in self.buffer:
+                if record.levelno < self.target.level or not self.target.filter(record):
+                    continue
+                try:
+                    lines.append(self.target.format(record) + self.target.terminator)
+                except Exception:
+                    self.target.handleError(record)
+
+            if lines:
+                self.target.acquire()
+                try:
+                    self.target.stream.write("".join(lines))
+                    self.target.flush()
+                except Exception:
+                    self.target.handleError(self.buffer[-1])
+                finally:
+                    self.target.release()
+            self.buffer.clear()
+        finally:
+            self.release()
 
 
 # ─────────────────────────── module-level logger ─────────────────────────────
@@ -49,16 +96,12 @@ def _build_handler() -> logging.Handler:
     Create and configure a logging handler with JSON formatting.
 
     Returns:
-        logging.Handler: Configured logging handler that outputs to stdout
-                         with JSON formatting.
+        logging.Handler: Configured logging handler that buffers records and
+                         outputs them to stdout with JSON formatting.
     """
     handler = logging.StreamHandler(sys.stdout)
-    formatter = JsonFormatter(
-        "%(asctime)s %(levelname)s %(name)s %(message)s "
-        "%(session_id)s %(aws_request_id)s"
-    )
-    handler.setFormatter(formatter)
-    return handler
+    handler.setFormatter(LineWiseJsonFormatter())
+    return BatchedMemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=handler)
 
 
 _logger = logging.getLogger(_LOGGER_NAME)
@@ -80,3 +123,12 @@ def get_logger() -> logging.Logger:
         logging.Logger: Configured logger instance for the application.
     """
     return _logger
+
+
+def flush_logs() -> None:
+    """
+    Write out any buffered log records. Call before returning from the lambda
+    handler so records are not lost when the execution environment is frozen.
+    """
+    for handler in _logger.handlers:
+        handler.flush()
@@ -2,27 +2,48 @@
 Logic orchestrator for health checker
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from logging import LoggerAdapter, Logger
 
 import boto3
 
 from .utils import (
-    prior_day_calls,
+    prior_day_summary,
+    prior_day_calls_batch,
     query_parser,
     threshold_checker,
     compare_run_times,
     get_current_UTC_date,
+    get_prior_UTC_date,
 )
 from .logger import get_logger
 from .database import init_pool
 from .secrets import get_db_config
-from .config import FUNCTIONS_TO_CHECK
+from .notification import publish_batch_to_topic
+from .config import EMAIL_TOPIC_ARN, FUNCTIONS_TO_CHECK
 
 # ────────────────────── Getting logger ─────────────────────────────
 
 logger = get_logger()
 
+# ───────────────── Database connection init ──────────────────
+
+_DB_INITIALISED = False
+
+
+def _init_database() -> None:
+    """
+    Initialise the database connection pool once per container, so warm
+    invocations skip the secret lookup and pool setup entirely
+    """
+    global _DB_INITIALISED
+    if _DB_INITIALISED:
+        return
+
+    init_pool(get_db_config())
+    _DB_INITIALISED = True
+
+
 # ────────────────────── Handler function ─────────────────────────────
 
 
@@ -39,30 +60,45 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
     """
     try:
-        session_id = get_current_UTC_date
+        today = get_current_UTC_date()
+        prior_date = get_prior_UTC_date()
         logger_ctx: LoggerAdapter[Logger] = LoggerAdapter(
             logger,
-            {"session_id": session_id, "aws_request_id": context.aws_request_id},
+            {"session_id": today, "aws_request_id": context.aws_request_id},
         )
         logger_ctx.info("Starting health check")
         # ───────────────── Database connection init ──────────────────
 
-        init_pool(get_db_config())
+        _init_database()
 
         # ───────────────── Main status check logic ──────────────────
 
         # query_result = prior_day_calls("ENWL_power_scraper")
         # logger.debug(f"{query_result}")
+        summary = prior_day_summary(FUNCTIONS_TO_CHECK, prior_date)
+
+        breaches: List[Tuple[str, float]] = []
         for function_name in FUNCTIONS_TO_CHECK:
-            query_result = prior_day_calls(function_name)
-            errored_rows = query_parser(query_result, function_name)
-            threshold_checker(errored_rows, query_result, function_name)
+            total, errored_count = summary.get(function_name, (0, 0))
+            error_rate = threshold_checker(errored_count, total, function_name, today)
+            if error_rate is not None:
+                breaches.append((function_name, error_rate))
+
+        # Publish all warnings together and only pull individual rows for
+        # functions that need reporting on
+        if breaches:
+            publish_batch_to_topic(EMAIL_TOPIC_ARN, breaches, today)
+            breached = [function_name for function_name, _ in breaches]
+            prior_calls = prior_day_calls_batch(breached, prior_date)
+            for function_name in breached:
+                errored_rows = query_parser(prior_calls[function_name], function_name)
+                logger.warning("Errored runs for %s: %s", function_name, errored_rows)
         # dif_times = compare_run_times("ENWL_power_scraper")
         # logger.info(f"{dif_times}")
 
         return {"status code": 200, "body": "Health check completed successfully"}
     except Exception as e:
-        logger.error(f"Error occured at main function call: {e}")
+        logger.error("Error occured at main function call: %s", e)
         raise
 
 
@@ -3,6 +3,7 @@ Handels SNS topic pushing
 """
 
 from datetime import datetime, timezone
+from typing import List, Tuple
 
 import boto3
 
@@ -17,20 +18,80 @@ logger = get_logger()
 
 _SNS_CLIENT = boto3.client("sns", "ap-southeast-2")
 
+_SNS_MAX_BATCH_SIZE = 10
 
-def publish_to_topic(topic_ARN: str, error_rate: float, date: str, function_name: str):
+
+class NotificationError(RuntimeError):
+    """Exception raised when health warnings could not be published."""
+
+    pass
+
+
+def _warning_message(function_name: str, error_rate: float, date: str) -> str:
     """
-    Publishes warning to AWS topic if health checker detects a threshold violation
+    Builds the body of a threshold violation warning
 
     Args:
-        topic_ARN: AWS topic ARN
+        function_name: function which health check was performed on
         error_rate: actual error rate for health checker call
         date: UTC date now
-        function_name: function which health check was performed on
+
+    Returns:
+        str: warning message
     """
-    logger.info(f"Health warning causing publishing to ARN topic: {topic_ARN}")
-    publish = _SNS_CLIENT.publish(
-        TopicArn=topic_ARN,
-        Message=f"Error rate on for {function_name} {date} of {error_rate} exceeded acceptable threshold of {ACCEPTABLE_ERROR_THRESHOLD}",
-        Subject=f"Health checker warning {date}",
+    return (
+        f"Error rate on for {function_name} {date} of {error_rate} exceeded "
+        f"acceptable threshold of {ACCEPTABLE_ERROR_THRESHOLD}"
     )
+
+
+def publish_batch_to_topic(
+    topic_ARN: str, breaches: List[Tuple[str, float]], date: str
+) -> None:
+    """
+    Publishes one warning per threshold violation to AWS topic, sending up to
+    10 warnings per SNS request
+
+    Args:
+        topic_ARN: AWS topic ARN
+        breaches: (function_name, error_rate) for each function which
+            breached the threshold
+        date: UTC date now
+
+    Raises:
+        NotificationError: If SNS reports any warning as not published
+    """
+    failed_ids: List[str] = []
+    logger.info(
+        "Health warnings for %s functions causing publishing to ARN topic: %s",
+        len(breaches),
+        topic_ARN,
+    )
+    for start in range(0, len(breaches), _SNS_MAX_BATCH_SIZE):
+        response = _SNS_CLIENT.publish_batch(
+            TopicArn=topic_ARN,
+            PublishBatchRequestEntries=[
+                {
+                    "Id": str(i),
+                    "Message": _warning_message(function_name, error_rate, date),
+                    "Subject": f"Health checker warning {date}",
+                }
+                for i, (function_name, error_rate) in enumerate(
+                    breaches[start : start + _SNS_MAX_BATCH_SIZE], start
+                )
+            ],
+        )
+        for failure in response.get("Failed", []):
+            logger.error(
+                "Failed to publish health warning %s: %s",
+                failure["Id"],
+                failure.get("Message"),
+            )
+            failed_ids.append(failure["Id"])
+
+    # PublishBatch reports per-entry failures rather than raising, so fail
+    # the invocation here instead of reporting a dropped alert as a success
+    if failed_ids:
+        raise NotificationError(
+            f"Failed to publish health warnings with ids {failed_ids}"
+        )
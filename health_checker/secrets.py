@@ -42,7 +42,7 @@ def _get_secret_payload(secret_name: str) -> Dict[str, str]:
         resp = _CLIENT.get_secret_value(SecretId=secret_name)
         return json.loads(resp["SecretString"])
     except _CLIENT.exceptions.ResourceNotFoundException as exc:
-        logger.error(f"Secret {secret_name} not found")
+        logger.error("Secret %s not found", secret_name)
         raise SecretError(f"Secret {secret_name} not found") from exc
     except Exception as exc:
         logger.error(
@@ -2,15 +2,24 @@
 Helper functions for health checker
 """
 
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 
 import boto3
 
 from .logger import get_logger
-from .database import return_function_rows
-from .config import ACCEPTABLE_ERROR_THRESHOLD, EMAIL_TOPIC_ARN, SCHEDULE_NAME
-from .notification import publish_to_topic
+from .database import (
+    return_function_rows,
+    return_multi_function_rows,
+    return_function_summary,
+    RUN_ID,
+    RECORDS_WRITTEN,
+    RECORDS_READ,
+    STATUS,
+    FUNCTION_START_TIME,
+)
+from .config import ACCEPTABLE_ERROR_THRESHOLD, SCHEDULE_NAME
 
 # ────────────────────── Getting logger ─────────────────────────────
 
@@ -18,6 +27,10 @@ logger = get_logger()
 
 # ────────────────────── Helper functions ─────────────────────────────
 
+_SUCCESS_STATUSES = frozenset({"success_with_data", "success_no_data"})
+
+_SCHEDULER_CLIENT = boto3.client("scheduler", "ap-southeast-2")
+
 
 def get_event_bridge_schedule() -> dict:
     """
@@ -26,11 +39,35 @@ def get_event_bridge_schedule() -> dict:
     Returns:
         dict: AWS event bridge schedule
     """
-    _CLIENT = boto3.client("scheduler", "ap-southeast-2")
-    response = _CLIENT.get_schedule(Name=SCHEDULE_NAME)
+    response = _SCHEDULER_CLIENT.get_schedule(Name=SCHEDULE_NAME)
     return response
 
 
+@lru_cache(maxsize=1)
+def get_schedule_rate() -> Tuple[int, str]:
+    """
+    Fetch and parse the eventbridge rate expression once per cold start,
+    since the schedule is effectively static
+
+    Returns:
+        Tuple[int, str]: rate value and unit, e.g. (3, "minutes")
+
+    Raises:
+        NotImplementedError: If the schedule uses a cron expression
+    """
+    rate_expression = get_schedule_expression(get_event_bridge_schedule())
+    if not "rate" in rate_expression:
+        logger.warning(
+            "Cron expression used for function schedule - this functionality is not added yet"
+        )
+        raise NotImplementedError
+
+    parts = rate_expression.split("(")
+    rate_part = parts[1].rstrip(")")
+    rate_value, rate = rate_part.split()
+    return int(rate_value), rate
+
+
 def prior_day_calls(function_name: str) -> List:
     """
     Obtains all prior day invokations for a given lambda function
@@ -39,17 +76,52 @@ def prior_day_calls(function_name: str) -> List:
         function_name: relevant lambda function
 
     Returns:
-        List: list of dicts, one dict for each call of the lambda funciton
+        List: list of row tuples, one for each call of the lambda funciton
         the prior day
     """
-    current_utc_datetime = datetime.now(timezone.utc)
-    prior_date = current_utc_datetime - timedelta(days=1)
-    prior_date = prior_date.strftime("%Y-%m-%d")
-    result = return_function_rows(function_name, prior_date)
+    result = return_function_rows(function_name, get_prior_UTC_date())
+    return result
+
+
+def prior_day_calls_batch(
+    function_names: List[str], prior_date: str
+) -> Dict[str, List]:
+    """
+    Obtains all prior day invokations for several lambda functions with a
+    single database query
+
+    Args:
+        function_names: relevant lambda functions
+        prior_date: prior day UTC date in %Y-%m-%d format
+
+    Returns:
+        Dict[str, List]: prior day calls for each function, keyed by
+        function name
+    """
+    result = return_multi_function_rows(function_names, prior_date)
     return result
 
 
-def query_parser(query_result: List[dict], function_name: str) -> List[List]:
+def prior_day_summary(
+    function_names: List[str], prior_date: str
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Obtains the total and errored prior day invokation counts for several
+    lambda functions with a single aggregate database query
+
+    Args:
+        function_names: relevant lambda functions
+        prior_date: prior day UTC date in %Y-%m-%d format
+
+    Returns:
+        Dict[str, Tuple[int, int]]: (total, errored) counts keyed by function
+        name
+    """
+    result = return_function_summary(function_names, prior_date)
+    return result
+
+
+def query_parser(query_result: List[tuple], function_name: str) -> List[List]:
     """
     From a lambda funciton's prior day calls, checks if there are any unsuccessful
     invokations, or if the records written and read don't match for any call
@@ -62,53 +134,66 @@ def query_parser(query_result: List[dict], function_name: str) -> List[List]:
         List[List]: list of each row that failed the checks, plus where the
         checks failed
     """
-    logger.info(f"Parsing database query results for function {function_name}")
+    logger.info("Parsing database query results for function %s", function_name)
     errored_rows: List[List] = []
     for row_data in query_result:
-        if row_data["records_written"] != row_data["records_read"]:
+        run_id = row_data[RUN_ID]
+        records_written = row_data[RECORDS_WRITTEN]
+        records_read = row_data[RECORDS_READ]
+        status = row_data[STATUS]
+        if records_written != records_read:
             errored_rows.append(
                 [
-                    row_data["run_id"],
-                    f"Records read != records written: {row_data['records_written']} != {row_data['records_read']}",
+                    run_id,
+                    f"Records read != records written: {records_written} != {records_read}",
                 ]
             )
-        elif (
-            row_data["status"].upper() != "SUCCESS_WITH_DATA"
-            and row_data["status"].upper() != "SUCCESS_NO_DATA"
-        ):
-            errored_rows.append(
-                [row_data["run_id"], f"Status was not successful: {row_data['status']}"]
-            )
+            continue
+        if (status.lower() if status else "") not in _SUCCESS_STATUSES:
+            errored_rows.append([run_id, f"Status was not successful: {status}"])
         # Add another here for delyed function start time?
     return errored_rows
 
 
 def threshold_checker(
-    errored_rows: List[List], query_result: List[dict], function_name: str
-):
+    errored_count: int,
+    total: int,
+    function_name: str,
+    today: str,
+) -> Optional[float]:
     """
     Checks if a function's error rate was above the acceptable rate for a given day.
-    If yes, calls the notification service
+    Notifying is left to the caller, so warnings can be published together
 
     Args:
-        errored_rows: all calls which were considered failed
-        query_result: all prior day invokations for the lambda function
+        errored_count: number of calls which were considered failed
+        total: number of prior day invokations for the lambda function
         function_name: lambda function name
+        today: current UTC date in %Y-%m-%d format
+
+    Returns:
+        Optional[float]: the error rate if it breached the acceptable
+        threshold, otherwise None
     """
-    error_rate: float = len(errored_rows) / len(query_result)
+    if not total:
+        logger.info("No invocations for %s; skipping", function_name)
+        return None
+
+    error_rate: float = errored_count / total
     if error_rate >= ACCEPTABLE_ERROR_THRESHOLD:
         logger.warning(
-            f"Error rate for {function_name} health check on {get_current_UTC_date()} "
-            f"was {error_rate}, > acceptable rate of {ACCEPTABLE_ERROR_THRESHOLD}"
+            "Error rate for %s health check on %s was %s, > acceptable rate of %s",
+            function_name,
+            today,
+            error_rate,
+            ACCEPTABLE_ERROR_THRESHOLD,
         )
-        publish_to_topic(
-            EMAIL_TOPIC_ARN, error_rate, get_current_UTC_date(), function_name
-        )
-        return
+        return error_rate
 
     logger.info(
-        f"Error rate for {function_name} health check on {get_current_UTC_date()} was {error_rate}"
+        "Error rate for %s health check on %s was %s", function_name, today, error_rate
     )
+    return None
 
 
 def get_current_UTC_date() -> str:
@@ -122,11 +207,24 @@ def get_current_UTC_date() -> str:
     return UTC_date
 
 
+def get_prior_UTC_date() -> str:
+    """
+    Obtains the prior day's UTC date in %Y-%m-%d format
+
+    Returns:
+        prior_date: prior day UTC date in specified format
+    """
+    prior_date = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    return prior_date
+
+
 # ─────────── Start time comparison helper functions ───────────────
 # Note these are not actually implemented
 
 
-def relative_start_time(function_name: str) -> datetime:
+def relative_start_time(
+    function_name: str, query_result: Optional[List[tuple]] = None
+) -> datetime:
     """
     Because lambda functions are called on a rate(...) basis, their first call
     each day is slightly different. This time is then the basis for comparison
@@ -135,81 +233,86 @@ def relative_start_time(function_name: str) -> datetime:
 
     Args:
         function_name: lambda function name
+        query_result: prior day calls for the function, fetched if not given
 
     Retuns:
         earliest_date: time of earliest call for the lambda on a given day
     """
-    query_result: List[dict] = prior_day_calls(function_name)
-    earliest_date: datetime = query_result[0]["function_start_time"]
-    for row in query_result:
-        if row["function_start_time"] < earliest_date:
-            earliest_date = row["function_start_time"]
-
+    if query_result is None:
+        query_result = prior_day_calls(function_name)
+    earliest_date: datetime = min(row[FUNCTION_START_TIME] for row in query_result)
     return earliest_date
 
 
-def generate_exp_times(function_name: str) -> list[datetime]:
+@lru_cache(maxsize=8)
+def _schedule_offsets(
+    rate_minutes: int, day_minutes: int = 24 * 60
+) -> Tuple[timedelta, ...]:
+    """
+    Offsets from the first call of the day for every expected call in a day
+
+    Args:
+        rate_minutes: minutes between scheduled calls
+        day_minutes: length of the schedule window in minutes
+
+    Returns:
+        Tuple[timedelta, ...]: offsets of each expected call
+    """
+    return tuple(
+        timedelta(minutes=minute) for minute in range(0, day_minutes, rate_minutes)
+    )
+
+
+def generate_exp_times(
+    function_name: str, earliest_time: Optional[datetime] = None
+) -> list[datetime]:
     """
     Based on the first call of the day, extrapolates the schedule of the other
     calls for the day
 
     Args:
         function_name: lmabda function name
+        earliest_time: first call time for the day, looked up if not given
 
     Retuns:
         expected_run_times: schedule of expected call times
     """
-    earliest_time: datetime = relative_start_time(function_name)
-    rate_expression = get_schedule_expression(get_event_bridge_schedule())
-    if not "rate" in rate_expression:
-        logger.warning(
-            f"Cron expression used for function schedule - this functionality is not added yet"
-        )
-        raise NotImplementedError
-
-    parts = rate_expression.split("(")
-    rate_part = parts[1].rstrip(")")
-    rate_value, rate = rate_part.split()
-
+    if earliest_time is None:
+        earliest_time = relative_start_time(function_name)
+    rate_value, rate = get_schedule_rate()
     if rate != "minutes":
         logger.warning(
-            f"Rate in different granularity to minutes used - functionality not added"
+            "Rate in different granularity to minutes used - functionality not added"
         )
         raise NotImplementedError
 
-    expected_run_times: List[datetime] = []
-    start_time = earliest_time
-
-    while start_time < earliest_time + timedelta(days=1):
-        expected_run_times.append(start_time)
-        start_time += timedelta(minutes=3)
-
-    logger.info(f"Expected schedule created")
+    expected_run_times: List[datetime] = [
+        earliest_time + offset for offset in _schedule_offsets(rate_value)
+    ]
+    logger.info("Expected schedule created")
     return expected_run_times
 
 
-def enumerate_run_times(function_name: str):
+def enumerate_run_times(
+    function_name: str, query_result: Optional[List[tuple]] = None
+) -> List[datetime]:
     """
     Enumerates the actual start_times of the given lambda function
     for a given day
 
     Args:
         function_name: lmabda function name
+        query_result: prior day calls for the function, fetched if not given
 
     Returns:
         enumerated_run_times: actual runtimes for lambda function in
         chronological order
     """
-    query_result: List[dict] = prior_day_calls(function_name)
-    function_start_times: List[datetime] = []
-    enumerated_run_times: dict = {}
-    for row in query_result:
-        function_start_times.append(row["function_start_time"])
-
-    function_start_times.sort()
-    for call, run_time in enumerate(function_start_times):
-        enumerated_run_times[call] = run_time
-
+    if query_result is None:
+        query_result = prior_day_calls(function_name)
+    enumerated_run_times: List[datetime] = sorted(
+        row[FUNCTION_START_TIME] for row in query_result
+    )
     return enumerated_run_times
 
 
@@ -240,17 +343,18 @@ def compare_run_times(function_name: str) -> list[dict]:
         dif_times: list of all different start_times including the expected
         and actual run times
     """
-    enumerated_run_times: dict[int, datetime] = enumerate_run_times(function_name)
-    expected_run_times: list[datetime] = generate_exp_times(function_name)
-    dif_times: List[dict] = []
-    logger.info(f"{len(expected_run_times)} vs {len(enumerated_run_times)}")
-    for i in range(len(enumerated_run_times)):
-        if enumerated_run_times[i] != expected_run_times[i]:
-            dif_times.append(
-                {
-                    "Expected_run_time": expected_run_times[i],
-                    "Actual_run_time": enumerated_run_times[i],
-                }
-            )
+    query_result: List[tuple] = prior_day_calls(function_name)
+    enumerated_run_times: List[datetime] = enumerate_run_times(
+        function_name, query_result
+    )
+    expected_run_times: list[datetime] = generate_exp_times(
+        function_name, relative_start_time(function_name, query_result)
+    )
+    logger.info("%s vs %s", len(expected_run_times), len(enumerated_run_times))
+    dif_times: List[dict] = [
+        {"Expected_run_time": expected, "Actual_run_time": actual}
+        for actual, expected in zip(enumerated_run_times, expected_run_times)
+        if actual != expected
+    ]
     # logger here?
     return dif_times
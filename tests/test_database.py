@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+import pytest
+
+from health_checker import database
+
+
+class _FakeCursor:
+    def __init__(self, rows) -> None:
+        self.rows = rows
+        self.executed = None
+
+    def execute(self, operation, params) -> None:
+        self.executed = (operation, params)
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, cursor: _FakeCursor) -> None:
+        self._cursor = cursor
+        self.calls: list[str] = []
+
+    def cursor(self) -> _FakeCursor:
+        return self._cursor
+
+    def commit(self) -> None:
+        self.calls.append("commit")
+
+    def rollback(self) -> None:
+        self.calls.append("rollback")
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+
+class _FakePool:
+    def __init__(self, connection: _FakeConnection) -> None:
+        self._connection = connection
+
+    def get_connection(self) -> _FakeConnection:
+        return self._connection
+
+
+def test_return_function_summary_maps_counts(monkeypatch) -> None:
+    cursor = _FakeCursor([("ENWL_power_scraper", 480, Decimal("12"))])
+    monkeypatch.setattr(database, "_POOL", _FakePool(_FakeConnection(cursor)))
+
+    summary = database.return_function_summary(
+        ["ENWL_power_scraper", "live_station_scraper"], "2025-10-27"
+    )
+
+    assert summary == {"ENWL_power_scraper": (480, 12)}
+    assert all(isinstance(count, int) for count in summary["ENWL_power_scraper"])
+    assert cursor.executed[1] == [
+        "ENWL_power_scraper",
+        "live_station_scraper",
+        "2025-10-27",
+        "2025-10-28",
+    ]
+
+
+def test_get_conn_without_pool_raises_database_error(monkeypatch) -> None:
+    monkeypatch.setattr(database, "_POOL", None)
+    with pytest.raises(database.DatabaseError, match="Pool not initialized"):
+        with database.get_conn():
+            pass
+
+
+def test_get_conn_rolls_back_on_error(monkeypatch) -> None:
+    connection = _FakeConnection(_FakeCursor([]))
+    monkeypatch.setattr(database, "_POOL", _FakePool(connection))
+
+    with pytest.raises(ValueError, match="bad row"):
+        with database.get_conn():
+            raise ValueError("bad row")
+
+    assert connection.calls == ["rollback", "close"]
@@ -0,0 +1,91 @@
+import io
+import json
+import logging
+
+from health_checker import logger as logger_module
+from health_checker.logger import (
+    BatchedMemoryHandler,
+    LineWiseJsonFormatter,
+    flush_logs,
+)
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def _build(level: int = logging.NOTSET):
+    stream = _CountingStream()
+    target = logging.StreamHandler(stream)
+    target.setLevel(level)
+    target.setFormatter(LineWiseJsonFormatter())
+    handler = BatchedMemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=target
+    )
+    test_logger = logging.getLogger(f"test_logger_{id(handler)}")
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+    return test_logger, handler, stream
+
+
+def test_records_buffered_until_error() -> None:
+    test_logger, _, stream = _build()
+    test_logger.info("first")
+    test_logger.warning("second")
+    assert stream.getvalue() == ""
+
+    test_logger.error("third")
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [
+        "first",
+        "second",
+        "third",
+    ]
+
+
+def test_batch_written_in_one_write() -> None:
+    test_logger, handler, stream = _build()
+    for i in range(5):
+        test_logger.info("record %s", i)
+    handler.flush()
+    assert stream.writes == 1
+    assert len(stream.getvalue().splitlines()) == 5
+    assert handler.buffer == []
+
+
+def test_target_level_and_filters_respected() -> None:
+    test_logger, handler, stream = _build(level=logging.WARNING)
+    handler.target.addFilter(lambda record: "skip" not in record.getMessage())
+    test_logger.info("below level")
+    test_logger.warning("skip me")
+    test_logger.warning("kept")
+    handler.flush()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert '"message":"kept"' in lines[0]
+
+
+def test_bad_record_dropped_without_losing_others() -> None:
+    test_logger, handler, stream = _build()
+    test_logger.info("missing arg %s %s", 1)
+    test_logger.info("fine")
+    handler.flush()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert '"message":"fine"' in lines[0]
+
+
+def test_flush_logs_flushes_module_logger(monkeypatch) -> None:
+    _, handler, stream = _build()
+    monkeypatch.setattr(logger_module._logger, "handlers", [handler])
+    logger_module.get_logger().info("buffered")
+    assert stream.getvalue() == ""
+    flush_logs()
+    assert '"message":"buffered"' in stream.getvalue()
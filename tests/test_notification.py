@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from health_checker import notification
+from health_checker.notification import NotificationError, publish_batch_to_topic
+
+TOPIC_ARN = "arn:aws:sns:ap-southeast-2:000000000000:Email_Alerts"
+
+
+def _mock_sns(monkeypatch, failed=None) -> MagicMock:
+    client = MagicMock()
+    client.publish_batch.return_value = {"Successful": [], "Failed": failed or []}
+    monkeypatch.setattr(notification, "_SNS_CLIENT", client)
+    return client
+
+
+def test_publish_batch_builds_entries(monkeypatch) -> None:
+    client = _mock_sns(monkeypatch)
+    publish_batch_to_topic(TOPIC_ARN, [("ENWL_power_scraper", 0.9)], "2025-10-28")
+
+    client.publish_batch.assert_called_once()
+    kwargs = client.publish_batch.call_args.kwargs
+    assert kwargs["TopicArn"] == TOPIC_ARN
+    [entry] = kwargs["PublishBatchRequestEntries"]
+    assert entry["Id"] == "0"
+    assert entry["Subject"] == "Health checker warning 2025-10-28"
+    assert "ENWL_power_scraper" in entry["Message"]
+    assert "0.9" in entry["Message"]
+
+
+def test_publish_batch_splits_into_groups_of_ten(monkeypatch) -> None:
+    client = _mock_sns(monkeypatch)
+    breaches = [(f"function_{i}", 0.9) for i in range(11)]
+    publish_batch_to_topic(TOPIC_ARN, breaches, "2025-10-28")
+
+    batches = [
+        call.kwargs["PublishBatchRequestEntries"]
+        for call in client.publish_batch.call_args_list
+    ]
+    assert [len(batch) for batch in batches] == [10, 1]
+    ids = [entry["Id"] for batch in batches for entry in batch]
+    assert ids == [str(i) for i in range(11)]
+
+
+def test_publish_batch_raises_on_failed_entries(monkeypatch) -> None:
+    client = _mock_sns(monkeypatch, failed=[{"Id": "0", "Message": "throttled"}])
+    breaches = [(f"function_{i}", 0.9) for i in range(11)]
+
+    with pytest.raises(NotificationError, match="'0'"):
+        publish_batch_to_topic(TOPIC_ARN, breaches, "2025-10-28")
+
+    # Remaining batches are still attempted before failing
+    assert client.publish_batch.call_count == 2
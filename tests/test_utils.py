@@ -0,0 +1,43 @@
+from health_checker import utils
+from health_checker.utils import query_parser, threshold_checker
+
+
+def test_threshold_checker_skips_no_invocations() -> None:
+    assert threshold_checker(0, 0, "ENWL_power_scraper", "2025-10-28") is None
+
+
+def test_threshold_checker_breach_at_threshold(monkeypatch) -> None:
+    monkeypatch.setattr(utils, "ACCEPTABLE_ERROR_THRESHOLD", 0.8)
+    assert threshold_checker(8, 10, "ENWL_power_scraper", "2025-10-28") == 0.8
+
+
+def test_threshold_checker_below_threshold(monkeypatch) -> None:
+    monkeypatch.setattr(utils, "ACCEPTABLE_ERROR_THRESHOLD", 0.8)
+    assert threshold_checker(7, 10, "ENWL_power_scraper", "2025-10-28") is None
+
+
+def _row(run_id, records_written, records_read, status):
+    return (run_id, records_written, records_read, status, None, "ENWL_power_scraper")
+
+
+def test_query_parser_status_checks() -> None:
+    errored_rows = query_parser(
+        [
+            _row(1, 5, 5, None),
+            _row(2, 5, 5, ""),
+            _row(3, 5, 5, "Success_With_Data"),
+            _row(4, 0, 0, "success_no_data"),
+            _row(5, 5, 5, "FAILED"),
+        ],
+        "ENWL_power_scraper",
+    )
+    assert errored_rows == [
+        [1, "Status was not successful: None"],
+        [2, "Status was not successful: "],
+        [5, "Status was not successful: FAILED"],
+    ]
+
+
+def test_query_parser_reports_row_once() -> None:
+    errored_rows = query_parser([_row(1, 5, 3, "FAILED")], "ENWL_power_scraper")
+    assert errored_rows == [[1, "Records read != records written: 5 != 3"]]